@@ -4,8 +4,9 @@ import psutil
 import argparse
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
 from datetime import datetime
-from prettytable import PrettyTable
+from operator import itemgetter
 
 # ------------------------
 # Logging Setup
@@ -21,49 +22,68 @@ logger.addHandler(handler)
 # Utility Functions
 # ------------------------
 
-def bytes_to_gb(bytes_val):
-    """Convert bytes to gigabytes (1 decimal)"""
-    return round(bytes_val / (1024 ** 3), 1)
+USAGE_TIMEOUT = 2.0  # Seconds to wait for a single disk_usage call
+_INV_GIB = 1.0 / (1 << 30)  # Multiply by this instead of dividing by 1024**3
 
 def collect_storage_info(include_all=False):
     """Collect info about mounted file systems"""
-    logger.debug(f"Collecting storage info (include_all={include_all})")
+    logger.debug("Collecting storage info (include_all=%s)", include_all)
     partitions = psutil.disk_partitions(all=include_all)
-    rows = []
+    parts = []
 
     for part in partitions:
-        logger.debug(f"Checking partition: {part.device} mounted on {part.mountpoint}")
+        logger.debug("Checking partition: %s mounted on %s", part.device, part.mountpoint)
 
         if not part.mountpoint:
-            logger.debug(f"Skipping {part.device}: empty mountpoint")
             continue
 
-        try:
-            usage = psutil.disk_usage(part.mountpoint)
-            fs_type = part.fstype or "unknown"
+        parts.append(part)
 
+    rows = []
+    if not parts:
+        return rows
+
+    # Query all mountpoints concurrently: disk_usage is a blocking statvfs
+    # syscall, so a slow mount (NFS, autofs) would otherwise stall the loop.
+    executor = ThreadPoolExecutor(max_workers=min(32, len(parts)))
+    try:
+        futures = [executor.submit(psutil.disk_usage, p.mountpoint) for p in parts]
+        for part, future in zip(parts, futures):
+            try:
+                usage = future.result(timeout=USAGE_TIMEOUT)
+            except FutureTimeout:
+                logger.warning("Timed out reading usage for mountpoint: %s", part.mountpoint)
+                continue
+            except PermissionError:
+                logger.warning("Permission denied for mountpoint: %s", part.mountpoint)
+                continue
+            except Exception as e:
+                logger.error("Failed to access %s: %s", part.mountpoint, e)
+                continue
+
+            fs_type = part.fstype or "unknown"
+            # No rounding: the table's float_format already prints one decimal.
             row = [
                 part.mountpoint,
-                bytes_to_gb(usage.total),
-                bytes_to_gb(usage.used),
-                bytes_to_gb(usage.free),
+                usage.total * _INV_GIB,
+                usage.used * _INV_GIB,
+                usage.free * _INV_GIB,
                 usage.percent,
                 fs_type
             ]
-            logger.debug(f"Adding row: {row}")
+            logger.debug("Adding row: %s", row)
             rows.append(row)
+    finally:
+        # Don't wait on workers stuck in statvfs against a dead mount.
+        executor.shutdown(wait=False, cancel_futures=True)
 
-        except PermissionError:
-            logger.warning(f"Permission denied for mountpoint: {part.mountpoint}")
-            continue
-        except Exception as e:
-            logger.error(f"Failed to access {part.mountpoint}: {e}")
-            continue
-
-    return sorted(rows, key=lambda x: x[4], reverse=True)
+    return sorted(rows, key=itemgetter(4), reverse=True)
 
 def print_storage_table(rows):
     """Display disk usage in a formatted table"""
+    # Imported here so merely loading the module doesn't pay for prettytable.
+    from prettytable import PrettyTable
+
     logger.debug("Preparing output table")
     table = PrettyTable()
     table.field_names = [
@@ -77,8 +97,7 @@ def print_storage_table(rows):
     table.align["Mount Point"] = "l"
     table.float_format = ".1"
 
-    for row in rows:
-        table.add_row(row)
+    table.add_rows(rows)
 
     print("\nCurrent Storage Status:")
     print(table)
@@ -14,6 +14,7 @@ from typing import List, Tuple
 # ------------------------
 WARNING_THRESHOLD = 85  # Percentage for warning color
 CRITICAL_THRESHOLD = 95  # Percentage for critical color
+_INV_GIB = 1.0 / (1 << 30)  # Multiply by this instead of dividing by 1024**3
 
 # ------------------------
 # Logging Setup
@@ -38,7 +39,7 @@ def setup_logging(verbose: bool = False) -> logging.Logger:
 # ------------------------
 def bytes_to_gb(bytes_val: int) -> float:
     """Convert bytes to gigabytes (1 decimal place)."""
-    return round(bytes_val / (1024 ** 3), 1)
+    return round(bytes_val * _INV_GIB, 1)
 
 def get_color_for_usage(percent: float) -> str:
     """Return color code based on usage percentage."""
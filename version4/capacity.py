@@ -2,24 +2,38 @@
 
 import psutil
 import argparse
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 import json
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from typing import List, Tuple, Dict, Optional
-from rich.console import Console
-from rich.table import Table
-from rich.json import JSON
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # ------------------------
 # Configuration
 # ------------------------
 
-console = Console()  # Define console at the top level
+@lru_cache(maxsize=1)
+def _get_console():
+    """Build the rich console on first use; --raw-json never pays for it."""
+    from rich.console import Console
+    return Console()
 
 class Config:
     WARNING_THRESHOLD = 85
     CRITICAL_THRESHOLD = 95
+    USAGE_TIMEOUT = 2.0  # Seconds to wait for a single disk usage probe
     PSEUDO_FS_TYPES = {
         'proc', 'sysfs', 'tmpfs', 'devtmpfs', 'devpts', 'cgroup', 'cgroup2',
         'pstore', 'bpf', 'securityfs', 'mqueue', 'hugetlbfs', 'tracefs'
@@ -36,103 +50,192 @@ def setup_logging(verbose: bool = False) -> logging.Logger:
         level = logging.DEBUG if verbose else logging.INFO
         logger.setLevel(level)
 
-        handler = logging.StreamHandler(sys.stderr)
-        handler.setFormatter(logging.Formatter(
+        # Log records go through a queue so probe workers never block on
+        # stderr I/O; a single listener thread owns the actual writes.
+        stream_handler = logging.StreamHandler(sys.stderr)
+        stream_handler.setFormatter(logging.Formatter(
             "%(asctime)s [%(levelname)s] %(message)s",
             datefmt="%Y-%m-%d %H:%M:%S"
         ))
-        logger.addHandler(handler)
+        log_queue = queue.SimpleQueue()
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+        listener = logging.handlers.QueueListener(log_queue, stream_handler)
+        listener.start()
+        atexit.register(listener.stop)
     return logger
 
 # ------------------------
 # Utility Functions
 # ------------------------
 
+# Hoisted to module scope so conversions don't rebuild the mapping per call.
+_UNIT_DIVISORS = {
+    'KB': 1024,
+    'MB': 1024**2,
+    'GB': 1024**3,
+    'TB': 1024**4
+}
+
 def bytes_to_human(bytes_val: int, unit: str = 'GB') -> float:
     """Convert bytes to specified unit (default: GB)."""
-    units = {
-        'KB': 1024,
-        'MB': 1024**2,
-        'GB': 1024**3,
-        'TB': 1024**4
-    }
-    divisor = units.get(unit.upper(), 1024**3)  # Default to GB
+    divisor = _UNIT_DIVISORS.get(unit.upper(), _UNIT_DIVISORS['GB'])  # Default to GB
     return round(bytes_val / divisor, 1)
 
-def get_color_for_usage(percent: float) -> str:
-    """Return rich color style based on usage percentage."""
-    if percent >= Config.CRITICAL_THRESHOLD:
-        return "bold red"
-    elif percent >= Config.WARNING_THRESHOLD:
-        return "yellow"
-    return "white"
+# Indexed by status bucket: 0 = OK, 1 = warning, 2 = critical.
+_COLORS = ("white", "yellow", "bold red")
+_STATUS = ("OK", "WARNING", "CRITICAL")
+
+# Frozen copy of the pseudo-fs set with its membership test pre-bound, so the
+# partition filter loop skips the Config attribute lookup and set rehash.
+_PSEUDO = frozenset(Config.PSEUDO_FS_TYPES)
+_is_pseudo = _PSEUDO.__contains__
+
+# Sort key -> StorageRows column, resolved once at import instead of per call.
+_SORT_COLUMNS = {
+    "mount": "mounts", "total": "totals", "used": "useds",
+    "free": "frees", "percent": "percents"
+}
+
+@dataclass
+class StorageRows:
+    """Column-oriented storage snapshot: numpy arrays for the numeric
+    columns, plain lists for the strings. Iterating yields one row at a
+    time, so renderers consume it like the old list of tuples."""
+    devices: List[str]
+    mounts: List[str]
+    totals: np.ndarray
+    useds: np.ndarray
+    frees: np.ndarray
+    percents: np.ndarray
+    fstypes: List[str]
+    buckets: np.ndarray  # 0 = OK, 1 = warning, 2 = critical
+
+    def __len__(self) -> int:
+        return len(self.devices)
+
+    def __iter__(self):
+        return zip(self.devices, self.mounts, self.totals, self.useds,
+                   self.frees, self.percents, self.fstypes, self.buckets)
+
+def _probe_partition(part) -> Tuple:
+    """Run the blocking disk_usage syscall for one partition (sizes in bytes)."""
+    usage = psutil.disk_usage(part.mountpoint)
+    return (
+        part.device,
+        part.mountpoint,
+        usage.total,
+        usage.used,
+        usage.free,
+        float(usage.percent),
+        part.fstype or "unknown"
+    )
 
-def collect_storage_info(include_all: bool = False, sort_key: str = "percent", 
-                        physical_only: bool = False) -> List[Tuple]:
+def collect_storage_info(include_all: bool = False, sort_key: str = "percent",
+                        physical_only: bool = False, unit: str = "GB") -> StorageRows:
     """Collect info about mounted file systems."""
     logger = logging.getLogger("DiskUsageMonitor")
-    logger.debug(f"Collecting storage info (include_all={include_all}, physical_only={physical_only})")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Collecting storage info (include_all=%s, physical_only=%s)",
+                     include_all, physical_only)
     partitions = psutil.disk_partitions(all=include_all)
-    rows = []
 
+    # Filter before submitting so rejected entries never cost a syscall.
+    parts = []
     for part in partitions:
         if not part.mountpoint:
             continue
 
-        if physical_only and (part.fstype in Config.PSEUDO_FS_TYPES or part.device.startswith('/dev/loop')):
+        if physical_only and (_is_pseudo(part.fstype) or part.device.startswith('/dev/loop')):
             continue
 
+        parts.append(part)
+
+    rows = []
+    if parts:
+        # Each probe is a blocking statvfs that can stall for hundreds of ms
+        # on a slow mount; running them in a pool makes the collection wall
+        # time track the slowest mount instead of the sum of all of them.
+        executor = ThreadPoolExecutor(max_workers=min(32, len(parts)))
         try:
-            usage = psutil.disk_usage(part.mountpoint)
-            fs_type = part.fstype or "unknown"
-            percent = float(usage.percent)
-
-            row = (
-                part.device,
-                part.mountpoint,
-                bytes_to_human(usage.total),
-                bytes_to_human(usage.used),
-                bytes_to_human(usage.free),
-                percent,
-                fs_type
-            )
-            rows.append(row)
-
-        except PermissionError:
-            logger.warning(f"Permission denied for mountpoint: {part.mountpoint}")
-            continue
-        except (OSError, ValueError) as e:
-            logger.error(f"Error accessing {part.mountpoint}: {e}", exc_info=logger.level == logging.DEBUG)
-            continue
+            futures = [executor.submit(_probe_partition, p) for p in parts]
+            for part, future in zip(parts, futures):
+                try:
+                    rows.append(future.result(timeout=Config.USAGE_TIMEOUT))
+                except FutureTimeout:
+                    logger.warning("Timed out reading usage for mountpoint: %s", part.mountpoint)
+                except PermissionError:
+                    logger.warning("Permission denied for mountpoint: %s", part.mountpoint)
+                except (OSError, ValueError) as e:
+                    logger.error("Error accessing %s: %s", part.mountpoint, e,
+                                 exc_info=logger.isEnabledFor(logging.DEBUG))
+        finally:
+            # Don't wait on workers stuck in statvfs against a dead mount.
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    if not rows:
+        empty = np.empty(0, dtype=np.float64)
+        return StorageRows([], [], empty, empty.copy(), empty.copy(), empty.copy(), [],
+                           np.empty(0, dtype=np.int8))
+
+    # Divisor is resolved once and the three size columns are converted
+    # with a single vectorized multiply instead of one call per cell.
+    inv_divisor = 1.0 / _UNIT_DIVISORS.get(unit.upper(), _UNIT_DIVISORS['GB'])
+    sizes = np.round(np.array([row[2:5] for row in rows], dtype=np.float64) * inv_divisor, 1)
+    percents = np.array([row[5] for row in rows], dtype=np.float64)
+    # Classify once here; renderers just index _COLORS/_STATUS by bucket.
+    buckets = ((percents >= Config.WARNING_THRESHOLD).astype(np.int8)
+               + (percents >= Config.CRITICAL_THRESHOLD))
+    cols = StorageRows(
+        devices=[row[0] for row in rows],
+        mounts=[row[1] for row in rows],
+        totals=sizes[:, 0],
+        useds=sizes[:, 1],
+        frees=sizes[:, 2],
+        percents=percents,
+        fstypes=[row[6] for row in rows],
+        buckets=buckets
+    )
 
-    sort_indices = {
-        "mount": 1, "total": 2, "used": 3, "free": 4, "percent": 5
-    }
-    return sorted(rows, key=lambda x: x[sort_indices[sort_key]], reverse=(sort_key != "mount"))
+    order = np.argsort(getattr(cols, _SORT_COLUMNS[sort_key]))
+    if sort_key != "mount":
+        order = order[::-1]
+    return StorageRows(
+        devices=[cols.devices[i] for i in order],
+        mounts=[cols.mounts[i] for i in order],
+        totals=cols.totals[order],
+        useds=cols.useds[order],
+        frees=cols.frees[order],
+        percents=cols.percents[order],
+        fstypes=[cols.fstypes[i] for i in order],
+        buckets=cols.buckets[order]
+    )
 
-def check_thresholds(rows: List[Tuple]) -> Tuple[bool, bool]:
+def check_thresholds(rows: StorageRows) -> Tuple[bool, bool]:
     """Check if any partitions exceed warning or critical thresholds."""
-    has_warning = any(row[5] >= Config.WARNING_THRESHOLD for row in rows)
-    has_critical = any(row[5] >= Config.CRITICAL_THRESHOLD for row in rows)
-    return has_warning, has_critical
+    # One pass: both answers fall out of the single worst bucket.
+    peak = int(rows.buckets.max(initial=0))
+    return peak >= 1, peak >= 2
 
 # ------------------------
 # Output Functions
 # ------------------------
 
-def print_storage_table(rows: List[Tuple]) -> None:
+def print_storage_table(rows: StorageRows, unit: str = "GB") -> None:
     """Display disk usage in a rich table."""
+    from rich.table import Table
+
     table = Table(title="Current Storage Status", show_lines=True)
     table.add_column("Device", justify="left", style="cyan", no_wrap=True)
     table.add_column("Mount Point", justify="left", style="magenta")
-    table.add_column("Total (GB)", justify="right")
-    table.add_column("Used (GB)", justify="right")
-    table.add_column("Free (GB)", justify="right")
+    table.add_column(f"Total ({unit})", justify="right")
+    table.add_column(f"Used ({unit})", justify="right")
+    table.add_column(f"Free ({unit})", justify="right")
     table.add_column("Use %", justify="right")
     table.add_column("Filesystem", justify="left")
 
-    for device, mount, total, used, free, percent, fs_type in rows:
-        color = get_color_for_usage(percent)
+    for device, mount, total, used, free, percent, fs_type, bucket in rows:
+        color = _COLORS[bucket]
         table.add_row(
             device,
             mount,
@@ -143,32 +246,47 @@ def print_storage_table(rows: List[Tuple]) -> None:
             fs_type
         )
 
-    console.print(table)
+    _get_console().print(table)
+
+def _dumps(obj) -> str:
+    """Serialize to indented JSON, preferring the orjson C extension."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
 
-def generate_json_output(rows: List[Tuple], rich_format: bool = True) -> None:
+def generate_json_output(rows: StorageRows, rich_format: bool = True) -> None:
     """Print JSON output with optional rich formatting."""
     output = [
         {
             "device": device,
             "mountpoint": mount,
-            "total_gb": total,
-            "used_gb": used,
-            "free_gb": free,
-            "usage_percent": percent,
+            "total_gb": float(total),
+            "used_gb": float(used),
+            "free_gb": float(free),
+            "usage_percent": float(percent),
             "filesystem": fs_type,
-            "status": (
-                "CRITICAL" if percent >= Config.CRITICAL_THRESHOLD else
-                "WARNING" if percent >= Config.WARNING_THRESHOLD else
-                "OK"
-            )
+            "status": _STATUS[bucket]
         }
-        for device, mount, total, used, free, percent, fs_type in rows
+        for device, mount, total, used, free, percent, fs_type, bucket in rows
     ]
 
     if rich_format:
-        console.print(JSON.from_data(output))
+        # print_json takes the serialized string directly; JSON.from_data
+        # would walk the data a second time to render it.
+        _get_console().print_json(_dumps(output))
+    elif sys.stdout.isatty():
+        sys.stdout.write(_dumps(output))
+        sys.stdout.write("\n")
     else:
-        print(json.dumps(output, indent=2))
+        # Piped consumers (jq in the epilog example) reformat anyway, so
+        # skip the pretty-printer and hand compact bytes to the binary
+        # buffer, bypassing the text-mode encoder.
+        if orjson is not None:
+            payload = orjson.dumps(output)
+        else:
+            payload = json.dumps(output, separators=(",", ":")).encode()
+        sys.stdout.flush()
+        sys.stdout.buffer.write(payload + b"\n")
 
 # ------------------------
 # Argument Parsing
@@ -223,7 +341,8 @@ def main():
     rows = collect_storage_info(
         include_all=args.all,
         sort_key=args.sort,
-        physical_only=args.physical
+        physical_only=args.physical,
+        unit=args.unit
     )
 
     has_warning, has_critical = check_thresholds(rows)
@@ -233,10 +352,14 @@ def main():
     elif args.json:
         generate_json_output(rows)
     else:
-        print_storage_table(rows)
+        print_storage_table(rows, unit=args.unit)
 
     if not args.no_timestamp:
-        console.print(f"[dim]Generated at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}[/dim]")
+        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        if args.raw_json:
+            print(f"Generated at: {timestamp}")
+        else:
+            _get_console().print(f"[dim]Generated at: {timestamp}[/dim]")
 
     logger.info("DiskUsageMonitor completed")
 
@@ -251,8 +374,8 @@ if __name__ == "__main__":
     try:
         main()
     except KeyboardInterrupt:
-        console.print("[bold red]Operation cancelled by user[/bold red]", file=sys.stderr)
+        print("\nOperation cancelled by user", file=sys.stderr)
         sys.exit(1)
     except Exception as e:
-        logging.getLogger("DiskUsageMonitor").critical(f"Unexpected error: {e}", exc_info=True)
+        logging.getLogger("DiskUsageMonitor").critical("Unexpected error: %s", e, exc_info=True)
         sys.exit(3)